@@ -241,9 +241,9 @@ def dict_param(
     """Ensures argument obj is a native Python dictionary, raises an exception if not, and otherwise
     returns obj.
     """
-    from dagster._utils import frozendict
+    if not isinstance(obj, dict):
+        from dagster._utils import frozendict
 
-    if not isinstance(obj, (frozendict, dict)):
         raise _param_type_mismatch_exception(
             obj, (frozendict, dict), param_name, additional_message=additional_message
         )
@@ -264,9 +264,9 @@ def opt_dict_param(
     """Ensures argument obj is either a dictionary or None; if the latter, instantiates an empty
     dictionary.
     """
-    from dagster._utils import frozendict
+    if obj is not None and not isinstance(obj, dict):
+        from dagster._utils import frozendict
 
-    if obj is not None and not isinstance(obj, (frozendict, dict)):
         raise _param_type_mismatch_exception(
             obj, (frozendict, dict), param_name, additional_message
         )
@@ -308,9 +308,9 @@ def opt_nullable_dict_param(
     additional_message: Optional[str] = None,
 ) -> Optional[Dict]:
     """Ensures argument obj is either a dictionary or None."""
-    from dagster._utils import frozendict
+    if obj is not None and not isinstance(obj, dict):
+        from dagster._utils import frozendict
 
-    if obj is not None and not isinstance(obj, (frozendict, dict)):
         raise _param_type_mismatch_exception(
             obj, (frozendict, dict), param_name, additional_message
         )
@@ -357,8 +357,6 @@ def dict_elem(
     value_type: Optional[TypeOrTupleOfTypes] = None,
     additional_message: Optional[str] = None,
 ) -> Dict:
-    from dagster._utils import frozendict
-
     dict_param(obj, "obj")
     str_param(key, "key")
 
@@ -366,7 +364,9 @@ def dict_elem(
         raise CheckError(f"{key} not present in dictionary {obj}")
 
     value = obj[key]
-    if not isinstance(value, (frozendict, dict)):
+    if not isinstance(value, dict):
+        from dagster._utils import frozendict
+
         raise _element_check_error(key, value, obj, (frozendict, dict), additional_message)
     else:
         return _check_mapping_entries(value, key_type, value_type, mapping_type=dict)
@@ -379,8 +379,6 @@ def opt_dict_elem(
     value_type: Optional[TypeOrTupleOfTypes] = None,
     additional_message: Optional[str] = None,
 ) -> Dict:
-    from dagster._utils import frozendict
-
     dict_param(obj, "obj")
     str_param(key, "key")
 
@@ -388,7 +386,7 @@ def opt_dict_elem(
 
     if value is None:
         return {}
-    elif not isinstance(value, (frozendict, dict)):
+    elif not isinstance(value, dict):
         raise _element_check_error(key, value, obj, dict, additional_message)
     else:
         return _check_mapping_entries(value, key_type, value_type, mapping_type=dict)
@@ -401,8 +399,6 @@ def opt_nullable_dict_elem(
     value_type: Optional[TypeOrTupleOfTypes] = None,
     additional_message: Optional[str] = None,
 ) -> Optional[Dict]:
-    from dagster._utils import frozendict
-
     dict_param(obj, "obj")
     str_param(key, "key")
 
@@ -410,7 +406,7 @@ def opt_nullable_dict_elem(
 
     if value is None:
         return None
-    elif not isinstance(value, (frozendict, dict)):
+    elif not isinstance(value, dict):
         raise _element_check_error(key, value, obj, dict, additional_message)
     else:
         return _check_mapping_entries(value, key_type, value_type, mapping_type=dict)
@@ -422,9 +418,9 @@ def is_dict(
     value_type: Optional[TypeOrTupleOfTypes] = None,
     additional_message: Optional[str] = None,
 ) -> Dict[T, U]:
-    from dagster._utils import frozendict
+    if not isinstance(obj, dict):
+        from dagster._utils import frozendict
 
-    if not isinstance(obj, (frozendict, dict)):
         raise _type_mismatch_error(obj, (frozendict, dict), additional_message)
 
     if not (key_type or value_type):
@@ -711,9 +707,9 @@ def list_param(
     of_type: Optional[TypeOrTupleOfTypes] = None,
     additional_message: Optional[str] = None,
 ) -> List[Any]:
-    from dagster._utils import frozenlist
+    if not isinstance(obj, list):
+        from dagster._utils import frozenlist
 
-    if not isinstance(obj, (frozenlist, list)):
         raise _param_type_mismatch_exception(
             obj, (frozenlist, list), param_name, additional_message
         )
@@ -736,9 +732,9 @@ def opt_list_param(
     If the of_type argument is provided, also ensures that list items conform to the type specified
     by of_type.
     """
-    from dagster._utils import frozenlist
+    if obj is not None and not isinstance(obj, list):
+        from dagster._utils import frozenlist
 
-    if obj is not None and not isinstance(obj, (frozenlist, list)):
         raise _param_type_mismatch_exception(
             obj, (frozenlist, list), param_name, additional_message
         )
@@ -783,9 +779,9 @@ def opt_nullable_list_param(
     If the of_type argument is provided, also ensures that list items conform to the type specified
     by of_type.
     """
-    from dagster._utils import frozenlist
+    if obj is not None and not isinstance(obj, list):
+        from dagster._utils import frozenlist
 
-    if obj is not None and not isinstance(obj, (frozenlist, list)):
         raise _param_type_mismatch_exception(
             obj, (frozenlist, list), param_name, additional_message
         )
@@ -1630,6 +1626,9 @@ def _check_mapping_entries(
     mapping_type: Type = collections.abc.Mapping,
 ) -> W:
     """Enforces that the keys/values conform to the types specified by key_type, value_type."""
+    if not (key_type or value_type):
+        return obj
+
     for key, value in obj.items():
         if key_type and not key_check(key, key_type):
             raise CheckError(
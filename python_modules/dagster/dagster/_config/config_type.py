@@ -1,12 +1,15 @@
 import typing
 from enum import Enum as PythonEnum
-from typing import Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Dict, List, Optional, cast
 
 import dagster._check as check
 from dagster._builtins import BuiltinEnum
 from dagster._config import UserConfigSchema
 from dagster._serdes import whitelist_for_serdes
 
+if TYPE_CHECKING:
+    from .snap import ConfigSchemaSnapshot
+
 
 @whitelist_for_serdes
 class ConfigTypeKind(PythonEnum):
@@ -74,6 +77,12 @@ def __init__(
             if type_params
             else None
         )
+        # built on first use by config_schema_snapshot_from_config_type
+        self._schema_snapshot: Optional["ConfigSchemaSnapshot"] = None
+        # built on first use by TraversalContext.from_config_type
+        self._all_config_types_by_key: Optional[Dict[str, "ConfigType"]] = None
+        # built on first use by post_process._has_custom_post_process
+        self._has_custom_post_process: Optional[bool] = None
 
     @property
     def description(self) -> Optional[str]:
@@ -11,6 +11,7 @@
 # the usual NamedTuple pattern here. See:
 # https://stackoverflow.com/questions/50530959/generic-namedtuple-in-python-3-6
 class EvaluateValueResult(Generic[T]):
+    __slots__ = ["success", "value", "errors"]
 
     success: Optional[bool]
     value: Optional[T]
@@ -1,4 +1,4 @@
-from typing import Any, Union, overload
+from typing import TYPE_CHECKING, Any, Dict, Union, overload
 
 import dagster._check as check
 from dagster._builtins import BuiltinEnum
@@ -12,6 +12,10 @@
 from .config_type import Array, ConfigAnyInstance, ConfigType, ConfigTypeKind
 from .field_utils import FIELD_NO_DEFAULT_PROVIDED, Map, all_optional_type
 
+if TYPE_CHECKING:
+    from .evaluate_value_result import EvaluateValueResult
+    from .traversal_context import TraversalType
+
 
 def _is_config_type_class(obj):
     return isinstance(obj, type) and is_subclass(obj, ConfigType)
@@ -310,6 +314,7 @@ def __init__(
             )
 
         self._default_value = default_value
+        self._processed_defaults: Dict["TraversalType", "EvaluateValueResult"] = {}
 
         # check explicit default value
         if self.default_provided:
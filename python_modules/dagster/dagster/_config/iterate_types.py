@@ -35,6 +35,11 @@ def config_schema_snapshot_from_config_type(
     config_type: ConfigType,
 ) -> ConfigSchemaSnapshot:
     check.inst_param(config_type, "config_type", ConfigType)
-    return ConfigSchemaSnapshot(
-        {ct.key: snap_from_config_type(ct) for ct in iterate_config_types(config_type)}
-    )
+    # Config types do not change once constructed, and this is computed on every validation and
+    # post-processing pass over a config value, so build it once per type.
+    # pylint: disable=protected-access
+    if config_type._schema_snapshot is None:
+        config_type._schema_snapshot = ConfigSchemaSnapshot(
+            {ct.key: snap_from_config_type(ct) for ct in iterate_config_types(config_type)}
+        )
+    return config_type._schema_snapshot
@@ -1,5 +1,5 @@
 import sys
-from typing import Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 import dagster._check as check
 from dagster._utils import ensure_single_item, frozendict, frozenlist
@@ -11,6 +11,9 @@
 from .stack import EvaluationStack
 from .traversal_context import TraversalContext, TraversalType
 
+if TYPE_CHECKING:
+    from .field import Field
+
 
 def post_process_config(config_type: ConfigType, config_value: Any) -> EvaluateValueResult:
     ctx = TraversalContext.from_config_type(
@@ -133,10 +136,8 @@ def _recurse_in_to_shape(
 
     fields = context.config_type.fields  # type: ignore
 
-    field_aliases = getattr(context.config_type, "field_aliases", None)
-    field_aliases = check.opt_dict_param(
-        field_aliases, "field_aliases", key_type=str, value_type=str
-    )
+    # the aliases were type checked when the Shape was constructed
+    field_aliases = getattr(context.config_type, "field_aliases", None) or {}
 
     incoming_fields = config_value.keys()
 
@@ -148,15 +149,15 @@ def _recurse_in_to_shape(
                 context.for_field(field_def, expected_field),
                 config_value[expected_field],
             )
-        elif expected_field in field_aliases and field_aliases[expected_field] in incoming_fields:
+        elif field_aliases.get(expected_field) in incoming_fields:
             processed_fields[expected_field] = _recursively_process_config(
                 context.for_field(field_def, expected_field),
                 config_value[field_aliases[expected_field]],
             )
 
         elif field_def.default_provided:
-            processed_fields[expected_field] = _recursively_process_config(
-                context.for_field(field_def, expected_field), field_def.default_value
+            processed_fields[expected_field] = _recursively_process_field_default(
+                context.for_field(field_def, expected_field), field_def
             )
 
         elif field_def.is_required:
@@ -184,16 +185,60 @@ def _recurse_in_to_shape(
     )
 
 
+def _recursively_process_field_default(
+    context: TraversalContext, field_def: "Field"
+) -> EvaluateValueResult:
+    # A field default does not depend on the incoming config, so unless post processing can
+    # look outside of the schema (e.g. StringSource reading env vars) the result is the same
+    # on every pass and is computed once per field.
+    # pylint: disable=protected-access
+    traversal_type = context.traversal_type
+    if traversal_type in field_def._processed_defaults:
+        return field_def._processed_defaults[traversal_type]
+
+    evr = _recursively_process_config(context, field_def.default_value)
+    if evr.success and (
+        not context.do_post_process or not _has_custom_post_process(field_def.config_type)
+    ):
+        field_def._processed_defaults[traversal_type] = evr
+    return evr
+
+
+def _has_custom_post_process(config_type: ConfigType) -> bool:
+    from .iterate_types import iterate_config_types
+
+    # pylint: disable=protected-access
+    if config_type._has_custom_post_process is None:
+        config_type._has_custom_post_process = any(
+            type(inner_type).post_process is not ConfigType.post_process
+            for inner_type in iterate_config_types(config_type)
+        )
+    return config_type._has_custom_post_process
+
+
 def _recurse_in_to_array(context: TraversalContext, config_value: Any) -> EvaluateValueResult:
     check.invariant(context.config_type.kind == ConfigTypeKind.ARRAY, "Unexpected non array type")
 
     if not config_value:
         return EvaluateValueResult.for_value([])
 
-    if context.config_type.inner_type.kind != ConfigTypeKind.NONEABLE:  # type: ignore
+    inner_type = context.config_type.inner_type  # type: ignore
+    if inner_type.kind != ConfigTypeKind.NONEABLE:
         if any((cv is None for cv in config_value)):
             check.failed("Null array member not caught in validation")
 
+    # Scalar items have no defaults to resolve, so they only need post processing. A failure
+    # falls through to the per-item walk below, which reports it against the offending index.
+    if inner_type.kind == ConfigTypeKind.SCALAR:
+        if not context.do_post_process:
+            return EvaluateValueResult.for_value(frozenlist(config_value))
+        try:
+            return EvaluateValueResult.for_value(
+                frozenlist([inner_type.post_process(item) for item in config_value])
+            )
+        except PostProcessingError:
+            pass
+
     results = [
         _recursively_process_config(context.for_array(idx), item)
         for idx, item in enumerate(config_value)
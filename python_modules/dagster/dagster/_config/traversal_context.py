@@ -6,7 +6,7 @@
 from .config_type import ConfigType
 from .field import Field
 from .iterate_types import config_schema_snapshot_from_config_type, iterate_config_types
-from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap, snap_from_config_type
+from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap
 from .stack import EvaluationStack
 
 
@@ -131,23 +131,29 @@ def __init__(
         )
         self._config_type = check.inst_param(config_type, "config_type", ConfigType)
         self._traversal_type = check.inst_param(traversal_type, "traversal_type", TraversalType)
-        self._all_config_types = check.dict_param(
-            all_config_types, "all_config_types", key_type=str, value_type=ConfigType
-        )
+        # The same dict, built from iterate_config_types in from_config_type, is handed down to
+        # every nested context, so don't re-walk its entries each time a field is traversed.
+        self._all_config_types = check.dict_param(all_config_types, "all_config_types")
 
     @staticmethod
     def from_config_type(
         config_type: ConfigType, stack: EvaluationStack, traversal_type: TraversalType
     ) -> "TraversalContext":
-        all_config_types = list(iterate_config_types(config_type))
         config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
+        # like the schema snapshot, the types reachable from a config type are fixed once it is
+        # constructed, so only walk them the first time the type is traversed
+        # pylint: disable=protected-access
+        if config_type._all_config_types_by_key is None:
+            config_type._all_config_types_by_key = {
+                ct.key: ct for ct in iterate_config_types(config_type)
+            }
         return TraversalContext(
             config_schema_snapshot=config_schema_snapshot,
-            config_type_snap=snap_from_config_type(config_type),
+            config_type_snap=config_schema_snapshot.get_config_snap(config_type.key),
             config_type=config_type,
             stack=stack,
             traversal_type=traversal_type,
-            all_config_types={ct.key: ct for ct in all_config_types},
+            all_config_types=config_type._all_config_types_by_key,
         )
 
     @property
@@ -27,7 +27,7 @@
 from .field import resolve_to_config_type
 from .iterate_types import config_schema_snapshot_from_config_type
 from .post_process import post_process_config
-from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap
+from .snap import ConfigSchemaSnapshot, ConfigTypeSnap
 from .stack import EvaluationStack
 from .traversal_context import ValidationContext
 
@@ -223,44 +223,34 @@ def _validate_shape_config(
     check.not_none_param(config_value, "config_value")
     check.bool_param(check_for_extra_incoming_fields, "check_for_extra_incoming_fields")
 
-    field_aliases = check.opt_dict_param(
-        cast(Dict[str, str], context.config_type_snap.field_aliases),
-        "field_aliases",
-        key_type=str,
-        value_type=str,
-    )
+    # the aliases were type checked when the Shape / snapshot was constructed
+    field_aliases = cast(Dict[str, str], context.config_type_snap.field_aliases or {})
 
     if not isinstance(config_value, dict):
         return EvaluateValueResult.for_error(create_dict_type_mismatch_error(context, config_value))
     config_value = cast(Dict[str, object], config_value)
 
     field_snaps = check.not_none(context.config_type_snap.fields)
-    defined_field_names = {cast(str, fs.name) for fs in field_snaps}
-    defined_field_names = defined_field_names.union(set(field_aliases.values()))
-
-    incoming_field_names = set(config_value.keys())
 
     errors: List[EvaluationError] = []
 
     if check_for_extra_incoming_fields:
+        defined_field_names = {cast(str, fs.name) for fs in field_snaps}
+        defined_field_names.update(field_aliases.values())
         _append_if_error(
             errors,
             _check_for_extra_incoming_fields(
                 context,
                 defined_field_names,
-                incoming_field_names,
+                set(config_value.keys()),
             ),
         )
 
-    _append_if_error(
-        errors,
-        _compute_missing_fields_error(context, field_snaps, incoming_field_names, field_aliases),
-    )
-
-    # dict is well-formed. now recursively validate all incoming fields
+    # dict is well-formed. now recursively validate all incoming fields, noting any required
+    # fields that are missing along the way
 
+    missing_fields = []
     field_errors = []
-    field_snaps = check.not_none(context.config_type_snap.fields)
     for field_snap in field_snaps:
         name = field_snap.name
         aliased_name = field_aliases.get(name)
@@ -282,6 +272,10 @@ def _validate_shape_config(
 
             if field_evr.errors:
                 field_errors += field_evr.errors
+        elif field_snap.is_required:
+            missing_fields.append(cast(str, name))
+
+    _append_if_error(errors, _compute_missing_fields_error(context, missing_fields))
 
     if field_errors:
         errors += field_errors
@@ -357,20 +351,8 @@ def _check_for_extra_incoming_fields(
 
 
 def _compute_missing_fields_error(
-    context: ValidationContext,
-    field_snaps: List[ConfigFieldSnap],
-    incoming_fields: Set[str],
-    field_aliases: Dict[str, str],
+    context: ValidationContext, missing_fields: List[str]
 ) -> Optional[EvaluationError]:
-    missing_fields = []
-
-    for field_snap in field_snaps:
-
-        field_alias = field_aliases.get(cast(str, field_snap.name))
-        if field_snap.is_required and field_snap.name not in incoming_fields:
-            if field_alias is None or field_alias not in incoming_fields:
-                missing_fields.append(cast(str, field_snap.name))
-
     if missing_fields:
         if len(missing_fields) == 1:
             return create_missing_required_field_error(context, missing_fields[0])
@@ -389,6 +371,16 @@ def validate_array_config(
     if not isinstance(config_value, list):
         return EvaluateValueResult.for_error(create_array_error(context, config_value))
 
+    # Long arrays are almost always arrays of scalars. If every item is valid there are no
+    # per-item errors to report, so skip building a context for each index.
+    inner_type_snap = context.config_schema_snapshot.get_config_snap(
+        context.config_type_snap.inner_type_key
+    )
+    if inner_type_snap.kind == ConfigTypeKind.SCALAR and all(
+        item is not None and is_config_scalar_valid(inner_type_snap, item) for item in config_value
+    ):
+        return EvaluateValueResult(True, list(config_value), [])  # type: ignore
+
     evaluation_results = [
         _validate_config(context.for_array(index), config_item)
         for index, config_item in enumerate(config_value)
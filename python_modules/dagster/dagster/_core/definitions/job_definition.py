@@ -3,6 +3,7 @@
     TYPE_CHECKING,
     AbstractSet,
     Any,
+    Callable,
     Dict,
     FrozenSet,
     List,
@@ -77,6 +78,8 @@
 class JobDefinition(PipelineDefinition):
 
     _cached_partition_set: Optional["PartitionSetDefinition"]
+    _cached_op_selection_job_defs: Dict[FrozenSet[str], "JobDefinition"]
+    _cached_asset_selection_job_defs: Dict[FrozenSet[AssetKey], "JobDefinition"]
     _subset_selection_data: Optional[Union[OpSelectionData, AssetSelectionData]]
     input_values: Mapping[str, object]
 
@@ -213,6 +216,8 @@ def __init__(
         )
 
         self._cached_partition_set: Optional["PartitionSetDefinition"] = None
+        self._cached_op_selection_job_defs = {}
+        self._cached_asset_selection_job_defs = {}
         self._subset_selection_data = _subset_selection_data
         self.input_values = input_values
         for input_name in sorted(list(self.input_values.keys())):
@@ -415,10 +420,20 @@ def get_job_def_for_subset_selection(
             not (op_selection and asset_selection),
             "op_selection and asset_selection cannot both be provided as args to execute_in_process",
         )
+        # Building a subset job rebuilds the graph (and for assets, the whole asset job), and the
+        # same selection tends to be requested repeatedly, so build each distinct selection once.
         if op_selection:
-            return self._get_job_def_for_op_selection(op_selection)
+            return _get_or_build_subset_job_def(
+                self._cached_op_selection_job_defs,
+                frozenset(op_selection),
+                lambda: self._get_job_def_for_op_selection(op_selection),
+            )
         if asset_selection:  # asset_selection:
-            return self._get_job_def_for_asset_selection(asset_selection)
+            return _get_or_build_subset_job_def(
+                self._cached_asset_selection_job_defs,
+                frozenset(asset_selection),
+                lambda: self._get_job_def_for_asset_selection(asset_selection),
+            )
         else:
             return self
 
@@ -428,20 +443,18 @@ def _get_job_def_for_asset_selection(
     ) -> "JobDefinition":
         asset_selection = check.opt_set_param(asset_selection, "asset_selection", AssetKey)
 
-        for asset in asset_selection:
-            nonexistent_assets = [
-                asset for asset in asset_selection if asset not in self.asset_layer.asset_keys
-            ]
+        asset_keys = self.asset_layer.asset_keys
+        nonexistent_assets = [asset for asset in asset_selection if asset not in asset_keys]
+        if nonexistent_assets:
             nonexistent_asset_strings = [
                 asset_str
                 for asset_str in (asset.to_string() for asset in nonexistent_assets)
                 if asset_str
             ]
-            if nonexistent_assets:
-                raise DagsterInvalidSubsetError(
-                    "Assets provided in asset_selection argument "
-                    f"{', '.join(nonexistent_asset_strings)} do not exist in parent asset group or job."
-                )
+            raise DagsterInvalidSubsetError(
+                "Assets provided in asset_selection argument "
+                f"{', '.join(nonexistent_asset_strings)} do not exist in parent asset group or job."
+            )
         asset_selection_data = AssetSelectionData(
             asset_selection=asset_selection,
             parent_job_def=self,
@@ -655,6 +668,24 @@ def with_logger_defs(self, logger_defs: Mapping[str, LoggerDefinition]) -> "JobD
         )
 
 
+# Each cached subset job holds a rebuilt graph, so only keep the most recently built selections
+# rather than every selection ever requested over the life of the job definition.
+_MAX_CACHED_SUBSET_JOB_DEFS = 32
+
+
+def _get_or_build_subset_job_def(
+    cache: Dict[FrozenSet[Any], "JobDefinition"],
+    selection_key: FrozenSet[Any],
+    build_job_def: Callable[[], "JobDefinition"],
+) -> "JobDefinition":
+    if selection_key not in cache:
+        if len(cache) >= _MAX_CACHED_SUBSET_JOB_DEFS:
+            # dicts preserve insertion order, so this drops the oldest selection
+            del cache[next(iter(cache))]
+        cache[selection_key] = build_job_def()
+    return cache[selection_key]
+
+
 def _swap_default_io_man(resources: Mapping[str, ResourceDefinition], job: PipelineDefinition):
     """
     Used to create the user facing experience of the default io_manager
@@ -54,6 +54,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.host_representation import PipelineIndex
+    from dagster._core.selector.subset_selector import DependencyGraph
     from dagster._core.snap import ConfigSchemaSnapshot, PipelineSnapshot
 
     from .run_config_schema import RunConfigSchema
@@ -168,6 +169,10 @@ def adder_resource(init_context):
     _parent_pipeline_def: Optional["PipelineDefinition"]
     _cached_run_config_schemas: Dict[str, "RunConfigSchema"]
     _cached_external_pipeline: Any
+    _cached_dep_graph: Optional["DependencyGraph"]
+    _cached_required_resource_defs: Dict[str, Dict[str, ResourceDefinition]]
+    _cached_pipeline_index: Optional["PipelineIndex"]
+    _cached_subset_defs: Dict[FrozenSet[str], "PipelineSubsetDefinition"]
     _version_strategy: VersionStrategy
 
     def __init__(
@@ -287,6 +292,10 @@ def __init__(
         )
         self._cached_run_config_schemas = {}
         self._cached_external_pipeline = None
+        self._cached_dep_graph = None
+        self._cached_required_resource_defs = {}
+        self._cached_pipeline_index = None
+        self._cached_subset_defs = {}
 
         self.version_strategy = check.opt_inst_param(
             version_strategy, "version_strategy", VersionStrategy
@@ -433,11 +442,14 @@ def available_modes(self) -> List[str]:
         return [mode_def.name for mode_def in self._mode_definitions]
 
     def get_required_resource_defs_for_mode(self, mode: str) -> Dict[str, ResourceDefinition]:
-        return {
-            resource_key: resource
-            for resource_key, resource in self.get_mode_definition(mode).resource_defs.items()
-            if resource_key in self._resource_requirements[mode]
-        }
+        # looked up both when resolving run config and when initializing resources for a run
+        if mode not in self._cached_required_resource_defs:
+            self._cached_required_resource_defs[mode] = {
+                resource_key: resource
+                for resource_key, resource in self.get_mode_definition(mode).resource_defs.items()
+                if resource_key in self._resource_requirements[mode]
+            }
+        return self._cached_required_resource_defs[mode]
 
     @property
     def all_node_defs(self) -> List[NodeDefinition]:
@@ -486,9 +498,22 @@ def dagster_type_named(self, name):
     def get_pipeline_subset_def(
         self, solids_to_execute: Optional[AbstractSet[str]]
     ) -> "PipelineDefinition":
-        return (
-            self if solids_to_execute is None else _get_pipeline_subset_def(self, solids_to_execute)
+        if solids_to_execute is None:
+            return self
+
+        # the same subset is requested repeatedly over the course of a run (e.g. each time the
+        # pipeline is reconstructed), so build it once per distinct set of solids. Callers
+        # normally already pass a frozenset, which can key the cache as is; its elements are
+        # checked when the subset is built.
+        subset_key = (
+            solids_to_execute
+            if isinstance(solids_to_execute, frozenset)
+            else frozenset(check.set_param(solids_to_execute, "solids_to_execute"))
         )
+        if subset_key not in self._cached_subset_defs:
+            self._cached_subset_defs[subset_key] = _get_pipeline_subset_def(self, subset_key)
+
+        return self._cached_subset_defs[subset_key]
 
     def has_preset(self, name: str) -> bool:
         check.str_param(name, "name")
@@ -510,6 +535,13 @@ def get_preset(self, name: str) -> PresetDefinition:
 
         return self._preset_dict[name]
 
+    def get_dependency_graph(self) -> "DependencyGraph":
+        from dagster._core.selector.subset_selector import generate_dep_graph
+
+        if self._cached_dep_graph is None:
+            self._cached_dep_graph = generate_dep_graph(self)
+        return self._cached_dep_graph
+
     def get_pipeline_snapshot(self) -> "PipelineSnapshot":
         return self.get_pipeline_index().pipeline_snapshot
 
@@ -520,9 +552,13 @@ def get_pipeline_index(self) -> "PipelineIndex":
         from dagster._core.host_representation import PipelineIndex
         from dagster._core.snap import PipelineSnapshot
 
-        return PipelineIndex(
-            PipelineSnapshot.from_pipeline_def(self), self.get_parent_pipeline_snapshot()
-        )
+        # building and hashing the snapshot walks the whole definition, and the snapshot and its
+        # id are each requested several times per run
+        if self._cached_pipeline_index is None:
+            self._cached_pipeline_index = PipelineIndex(
+                PipelineSnapshot.from_pipeline_def(self), self.get_parent_pipeline_snapshot()
+            )
+        return self._cached_pipeline_index
 
     def get_config_schema_snapshot(self) -> "ConfigSchemaSnapshot":
         return self.get_pipeline_snapshot().config_schema_snapshot
@@ -8,7 +8,8 @@
 # See: https://github.com/python/mypy/issues/7281
 
 from collections import namedtuple
-from typing import AbstractSet, Mapping, NamedTuple, Optional
+from functools import lru_cache
+from typing import AbstractSet, Mapping, NamedTuple, Optional, Tuple, Type
 
 import dagster._check as check
 from dagster._core.errors import DagsterUnknownResourceError
@@ -76,27 +77,38 @@ def build(self, required_resource_keys: Optional[AbstractSet[str]]) -> Resources
             if key in self.resource_instance_dict
         }
 
-        # If any of the resources are generators, add the IContainsGenerator subclass to flag that
-        # this is the case.
-        if self.contains_generator:
-
-            class _ScopedResourcesContainsGenerator(
-                namedtuple("_ScopedResourcesContainsGenerator", list(resource_instance_dict.keys())),  # type: ignore[misc]
-                Resources,
-                IContainsGenerator,
-            ):
-                def __getattr__(self, attr):
-                    raise DagsterUnknownResourceError(attr)
-
-            return _ScopedResourcesContainsGenerator(**resource_instance_dict)  # type: ignore[call-arg]
-
-        else:
-
-            class _ScopedResources(
-                namedtuple("_ScopedResources", list(resource_instance_dict.keys())),  # type: ignore[misc]
-                Resources,
-            ):
-                def __getattr__(self, attr):
-                    raise DagsterUnknownResourceError(attr)
-
-            return _ScopedResources(**resource_instance_dict)  # type: ignore[call-arg]
+        resources_cls = _scoped_resources_cls(
+            tuple(resource_instance_dict.keys()), self.contains_generator
+        )
+        return resources_cls(**resource_instance_dict)  # type: ignore[call-arg]
+
+
+# Resources are scoped once per step and again for every input and output manager, so reuse the
+# generated namedtuple types rather than creating a new class on each build. The cache is bounded
+# since long-lived processes can see an unbounded number of distinct resource key sets.
+@lru_cache(maxsize=128)
+def _scoped_resources_cls(resource_keys: Tuple[str, ...], contains_generator: bool) -> Type:
+    # If any of the resources are generators, add the IContainsGenerator subclass to flag that
+    # this is the case.
+    if contains_generator:
+
+        class _ScopedResourcesContainsGenerator(
+            namedtuple("_ScopedResourcesContainsGenerator", resource_keys),  # type: ignore[misc]
+            Resources,
+            IContainsGenerator,
+        ):
+            def __getattr__(self, attr):
+                raise DagsterUnknownResourceError(attr)
+
+        return _ScopedResourcesContainsGenerator
+
+    else:
+
+        class _ScopedResources(
+            namedtuple("_ScopedResources", resource_keys),  # type: ignore[misc]
+            Resources,
+        ):
+            def __getattr__(self, attr):
+                raise DagsterUnknownResourceError(attr)
+
+        return _ScopedResources
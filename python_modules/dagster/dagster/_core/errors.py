@@ -145,10 +145,10 @@ def __init__(self, *args, **kwargs):
         super(DagsterStepOutputNotFoundError, self).__init__(*args, **kwargs)
 
 
-@contextmanager
 def raise_execution_interrupts():
-    with raise_interrupts_as(DagsterExecutionInterruptedError):
-        yield
+    # Hand back the underlying context manager rather than wrapping it in another generator-based
+    # one, since this is entered around every piece of user code that the framework invokes.
+    return raise_interrupts_as(DagsterExecutionInterruptedError)
 
 
 @contextmanager
@@ -326,14 +326,16 @@ def __init__(self, preamble, errors, config_value, *args, **kwargs):
         self.errors = check.list_param(errors, "errors", of_type=EvaluationError)
         self.config_value = config_value
 
-        error_msg = preamble
-        error_messages = []
-
-        for i_error, error in enumerate(self.errors):
-            error_messages.append(error.message)
-            error_msg += "\n    Error {i_error}: {error_message}".format(
-                i_error=i_error + 1, error_message=error.message
-            )
+        error_messages = [error.message for error in self.errors]
+        error_msg = "\n".join(
+            [preamble]
+            + [
+                "    Error {i_error}: {error_message}".format(
+                    i_error=i_error + 1, error_message=error_message
+                )
+                for i_error, error_message in enumerate(error_messages)
+            ]
+        )
 
         self.message = error_msg
         self.error_messages = error_messages
@@ -152,6 +152,16 @@ class DagsterEventType(Enum):
     LOGS_CAPTURED = "LOGS_CAPTURED"
 
 
+# event types are looked up from their serialized values for every is_* check on an event, so
+# resolve them with a dict lookup rather than through the Enum constructor
+_EVENT_TYPE_BY_VALUE = {event_type.value: event_type for event_type in DagsterEventType}
+
+
+def _event_type_from_value(event_type_value: str) -> DagsterEventType:
+    # falls back to the Enum constructor to raise its usual error for unrecognized values
+    return _EVENT_TYPE_BY_VALUE.get(event_type_value) or DagsterEventType(event_type_value)
+
+
 EVENT_TYPE_VALUE_TO_DISPLAY_STRING = {
     "PIPELINE_ENQUEUED": "RUN_ENQUEUED",
     "PIPELINE_DEQUEUED": "RUN_DEQUEUED",
@@ -513,7 +523,9 @@ def __new__(
             check.opt_inst_param(solid_handle, "solid_handle", NodeHandle),
             check.opt_str_param(step_kind_value, "step_kind_value"),
             check.opt_dict_param(logging_tags, "logging_tags"),
-            _validate_event_specific_data(DagsterEventType(event_type_value), event_specific_data),
+            _validate_event_specific_data(
+                _event_type_from_value(event_type_value), event_specific_data
+            ),
             check.opt_str_param(message, "message"),
             check.opt_int_param(pid, "pid"),
             check.opt_str_param(step_key, "step_key"),
@@ -528,7 +540,7 @@ def solid_name(self) -> str:
     @property
     def event_type(self) -> DagsterEventType:
         """DagsterEventType: The type of this event."""
-        return DagsterEventType(self.event_type_value)
+        return _event_type_from_value(self.event_type_value)
 
     @property
     def is_step_event(self) -> bool:
@@ -991,12 +991,7 @@ def create_execution_plan(
     check.opt_nullable_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
     check.opt_inst_param(instance_ref, "instance_ref", InstanceRef)
     tags = check.opt_dict_param(tags, "tags", key_type=str, value_type=str)
-    known_state = check.opt_inst_param(
-        known_state,
-        "known_state",
-        KnownExecutionState,
-        default=KnownExecutionState(),
-    )
+    check.opt_inst_param(known_state, "known_state", KnownExecutionState)
 
     resolved_run_config = ResolvedRunConfig.build(pipeline_def, run_config, mode=mode)
 
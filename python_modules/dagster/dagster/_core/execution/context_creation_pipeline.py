@@ -2,6 +2,7 @@
 import sys
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -24,6 +25,7 @@
 import dagster._check as check
 from dagster._core.definitions import ExecutorDefinition, ModeDefinition, PipelineDefinition
 from dagster._core.definitions.executor_definition import check_cross_process_constraints
+from dagster._core.definitions.logger_definition import LoggerDefinition
 from dagster._core.definitions.pipeline_base import IPipeline
 from dagster._core.definitions.resource_definition import ScopedResourcesBuilder
 from dagster._core.errors import DagsterError, DagsterUserCodeExecutionError
@@ -40,7 +42,12 @@
 from dagster._core.log_manager import DagsterLogManager
 from dagster._core.storage.pipeline_run import PipelineRun
 from dagster._core.system_config.objects import ResolvedRunConfig
-from dagster._loggers import default_loggers, default_system_loggers
+from dagster._loggers import (
+    colored_console_logger,
+    default_loggers,
+    default_system_loggers,
+    json_console_logger,
+)
 from dagster._utils import EventGenerationManager
 from dagster._utils.error import serializable_error_info_from_exc_info
 
@@ -58,6 +65,42 @@
     from dagster._core.executor.base import Executor
 
 
+# The console loggers shipped with dagster hold no run-specific state once constructed, and a
+# single run builds several contexts, so instead of rebuilding them (and reinstalling their stream
+# handlers) for every context we reuse one instance per logger definition, config and run. Keying
+# on the run means each run gets fresh handlers, and the cache is bounded so finished runs drop out.
+_CONSOLE_LOGGER_DEFS = (colored_console_logger, json_console_logger)
+
+
+@lru_cache(maxsize=16)
+def _get_console_logger(
+    logger_def: LoggerDefinition, name: str, log_level: str, run_id: Optional[str]
+) -> logging.Logger:
+    return logger_def.logger_fn(
+        InitLoggerContext({"name": name, "log_level": log_level}, logger_def, run_id=run_id)
+    )
+
+
+def _create_logger(
+    logger_def: LoggerDefinition,
+    logger_config: Any,
+    pipeline_def: Optional[PipelineDefinition] = None,
+    run_id: Optional[str] = None,
+) -> logging.Logger:
+    init_context = InitLoggerContext(
+        logger_config, logger_def, pipeline_def=pipeline_def, run_id=run_id
+    )
+    if logger_def not in _CONSOLE_LOGGER_DEFS:
+        return logger_def.logger_fn(init_context)
+
+    return _get_console_logger(
+        logger_def,
+        str(init_context.logger_config["name"]),
+        str(init_context.logger_config["log_level"]),
+        run_id,
+    )
+
+
 def initialize_console_manager(
     pipeline_run: Optional[PipelineRun], instance: Optional[DagsterInstance] = None
 ) -> DagsterLogManager:
@@ -65,10 +108,8 @@ def initialize_console_manager(
     loggers = []
     for logger_def, logger_config in default_system_loggers():
         loggers.append(
-            logger_def.logger_fn(
-                InitLoggerContext(
-                    logger_config, logger_def, run_id=pipeline_run.run_id if pipeline_run else None
-                )
+            _create_logger(
+                logger_def, logger_config, run_id=pipeline_run.run_id if pipeline_run else None
             )
         )
     return DagsterLogManager.create(loggers=loggers, pipeline_run=pipeline_run, instance=instance)
@@ -125,7 +166,9 @@ def create_context_creation_data(
     instance: DagsterInstance,
 ) -> "ContextCreationData":
     pipeline_def = pipeline.get_definition()
-    resolved_run_config = ResolvedRunConfig.build(pipeline_def, run_config, mode=pipeline_run.mode)
+    resolved_run_config = _resolved_run_config_for_plan(
+        pipeline_def, execution_plan, run_config, pipeline_run.mode
+    )
 
     mode_def = pipeline_def.get_mode_definition(pipeline_run.mode)
     executor_def = executor_def_from_config(mode_def, resolved_run_config)
@@ -144,6 +187,25 @@ def create_context_creation_data(
     )
 
 
+def _resolved_run_config_for_plan(
+    pipeline_def: PipelineDefinition,
+    execution_plan: ExecutionPlan,
+    run_config: Mapping[str, object],
+    mode: Optional[str],
+) -> ResolvedRunConfig:
+    # The execution plan for a run has usually already resolved the run's config, so reuse that
+    # rather than validating the same config again for each context created during the run.
+    resolved_run_config = execution_plan.resolved_run_config
+    if (
+        resolved_run_config is not None
+        and resolved_run_config.mode == (mode or pipeline_def.get_default_mode_name())
+        and resolved_run_config.original_config_dict == run_config
+    ):
+        return resolved_run_config
+
+    return ResolvedRunConfig.build(pipeline_def, run_config, mode=mode)
+
+
 def create_plan_data(
     context_creation_data: "ContextCreationData", raise_on_error: bool, retry_mode: RetryMode
 ) -> PlanData:
@@ -492,26 +554,22 @@ def create_log_manager(
     for logger_key, logger_def in mode_def.loggers.items() or default_loggers().items():
         if logger_key in resolved_run_config.loggers:
             loggers.append(
-                logger_def.logger_fn(
-                    InitLoggerContext(
-                        resolved_run_config.loggers.get(logger_key, {}).get("config"),
-                        logger_def,
-                        pipeline_def=pipeline_def,
-                        run_id=pipeline_run.run_id,
-                    )
+                _create_logger(
+                    logger_def,
+                    resolved_run_config.loggers.get(logger_key, {}).get("config"),
+                    pipeline_def=pipeline_def,
+                    run_id=pipeline_run.run_id,
                 )
             )
 
     if not loggers:
         for (logger_def, logger_config) in default_system_loggers():
             loggers.append(
-                logger_def.logger_fn(
-                    InitLoggerContext(
-                        logger_config,
-                        logger_def,
-                        pipeline_def=pipeline_def,
-                        run_id=pipeline_run.run_id,
-                    )
+                _create_logger(
+                    logger_def,
+                    logger_config,
+                    pipeline_def=pipeline_def,
+                    run_id=pipeline_run.run_id,
                 )
             )
 
@@ -535,15 +593,6 @@ def create_context_free_log_manager(
     loggers = []
     # Use the default logger
     for (logger_def, logger_config) in default_system_loggers():
-        loggers += [
-            logger_def.logger_fn(
-                InitLoggerContext(
-                    logger_config,
-                    logger_def,
-                    pipeline_def=None,
-                    run_id=pipeline_run.run_id,
-                )
-            )
-        ]
+        loggers += [_create_logger(logger_def, logger_config, run_id=pipeline_run.run_id)]
 
     return DagsterLogManager.create(loggers=loggers, instance=instance, pipeline_run=pipeline_run)
@@ -52,7 +52,20 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
+        self._pending: Dict[str, Set[str]] = {}
+
+        # Rather than rescanning every pending step on each _update, track the pending steps
+        # whose upstream state has changed since the last _update. A step only becomes
+        # actionable once one of its requirements completes, so _dependents (the reverse of
+        # _pending) is used to mark downstream steps as candidates in _mark_complete.
+        self._dependents: Dict[str, Set[str]] = {}
+        self._update_candidates: Set[str] = set()
+        # preserve the order in which steps were added to _pending when processing candidates
+        self._pending_order: Dict[str, int] = {}
+        self._pending_counter: int = 0
+
+        for step_key, requirements in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, requirements)
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -149,23 +162,28 @@ def _update(self) -> None:
         new_steps_to_skip = []
         new_steps_to_abandon = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._successful_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
+        candidates = sorted(
+            (key for key in self._update_candidates if key in self._pending),
+            key=self._pending_order.__getitem__,
+        )
+        self._update_candidates = set()
+
+        for step_key in candidates:
+            requirements = self._pending[step_key]
+
             # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
+            if any(req in self._failed or req in self._abandoned for req in requirements):
                 new_steps_to_abandon.append(step_key)
 
             # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
+            elif all(req in self._success or req in self._skipped for req in requirements):
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step won't skip
@@ -373,7 +391,7 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._plan.get_executable_step_deps()[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
@@ -391,6 +409,15 @@ def _mark_complete(self, step_key: str) -> None:
             ),
         )
         self._in_flight.remove(step_key)
+        self._update_candidates.update(self._dependents.get(step_key, ()))
+
+    def _add_pending(self, step_key: str, requirements: Set[str]) -> None:
+        self._pending[step_key] = requirements
+        self._pending_order[step_key] = self._pending_counter
+        self._pending_counter += 1
+        for requirement in requirements:
+            self._dependents.setdefault(requirement, set()).add(step_key)
+        self._update_candidates.add(step_key)
 
     def handle_event(self, dagster_event: DagsterEvent) -> None:
         check.inst_param(dagster_event, "dagster_event", DagsterEvent)
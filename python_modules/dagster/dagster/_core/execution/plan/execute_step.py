@@ -41,7 +41,7 @@
 from dagster._core.storage.io_manager import IOManager
 from dagster._core.storage.tags import MEMOIZED_RUN_TAG
 from dagster._core.types.dagster_type import DagsterType
-from dagster._utils import ensure_gen, iterate_with_context
+from dagster._utils import iterate_with_context
 from dagster._utils.backcompat import ExperimentalWarning, experimental_functionality_warning
 from dagster._utils.timing import time_execution_scope
 
@@ -316,9 +316,16 @@ def core_dagster_event_sequence_for_step(
         if dagster_type.is_nothing:
             continue
 
-        for event_or_input_value in ensure_gen(
-            step_input.source.load_input_object(step_context, input_def)
-        ):
+        input_value_or_gen = step_input.source.load_input_object(step_context, input_def)
+
+        # sources that resolve their value directly emit no events, so store the value without
+        # wrapping it in a generator
+        if not inspect.isgenerator(input_value_or_gen):
+            check.invariant(step_input.name not in inputs)
+            inputs[step_input.name] = input_value_or_gen
+            continue
+
+        for event_or_input_value in input_value_or_gen:
             if isinstance(event_or_input_value, DagsterEvent):
                 yield event_or_input_value
             else:
@@ -659,7 +666,7 @@ def _create_type_materializations(
 
         for output_spec in solid_config.outputs.type_materializer_specs:
             check.invariant(len(output_spec) == 1)  # type: ignore
-            config_output_name, output_spec = list(output_spec.items())[0]  # type: ignore
+            config_output_name, output_spec = next(iter(output_spec.items()))  # type: ignore
             if config_output_name == output_name:
                 step_output = step.step_output_named(output_name)
                 with user_code_error_boundary(
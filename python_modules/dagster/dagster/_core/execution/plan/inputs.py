@@ -42,6 +42,9 @@
     from dagster._core.execution.context.system import StepExecutionContext
     from dagster._core.storage.input_manager import InputManager
 
+# shared back-compat placeholder for the deprecated solid_handle field on step input sources
+_PLACEHOLDER_SOLID_HANDLE = NodeHandle("", None)
+
 
 def _get_asset_lineage_from_fns(
     context, asset_key_fn, asset_partitions_fn
@@ -424,7 +427,7 @@ def __new__(
             fan_in=check.bool_param(fan_in, "fan_in"),
             # add placeholder values for back-compat
             solid_handle=check.opt_inst_param(
-                solid_handle, "solid_handle", NodeHandle, default=NodeHandle("", None)
+                solid_handle, "solid_handle", NodeHandle, default=_PLACEHOLDER_SOLID_HANDLE
             ),
             input_name=check.opt_str_param(input_name, "input_handle", default=""),
         )
@@ -766,7 +769,7 @@ def __new__(
             sources=sources,
             # add placeholder values for back-compat
             solid_handle=check.opt_inst_param(
-                solid_handle, "solid_handle", NodeHandle, default=NodeHandle("", None)
+                solid_handle, "solid_handle", NodeHandle, default=_PLACEHOLDER_SOLID_HANDLE
             ),
             input_name=check.opt_str_param(input_name, "input_handle", default=""),
         )
@@ -901,7 +904,7 @@ def __new__(
             step_output_handle=step_output_handle,
             # add placeholder values for back-compat
             solid_handle=check.opt_inst_param(
-                solid_handle, "solid_handle", NodeHandle, default=NodeHandle("", None)
+                solid_handle, "solid_handle", NodeHandle, default=_PLACEHOLDER_SOLID_HANDLE
             ),
             input_name=check.opt_str_param(input_name, "input_handle", default=""),
         )
@@ -966,7 +969,7 @@ def __new__(
             ),
             # add placeholder values for back-compat
             solid_handle=check.opt_inst_param(
-                solid_handle, "solid_handle", NodeHandle, default=NodeHandle("", None)
+                solid_handle, "solid_handle", NodeHandle, default=_PLACEHOLDER_SOLID_HANDLE
             ),
             input_name=check.opt_str_param(input_name, "input_handle", default=""),
         )
@@ -1017,7 +1020,7 @@ def __new__(
             source=source,
             # add placeholder values for back-compat
             solid_handle=check.opt_inst_param(
-                solid_handle, "solid_handle", NodeHandle, default=NodeHandle("", None)
+                solid_handle, "solid_handle", NodeHandle, default=_PLACEHOLDER_SOLID_HANDLE
             ),
             input_name=check.opt_str_param(input_name, "input_handle", default=""),
         )
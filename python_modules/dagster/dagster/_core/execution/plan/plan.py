@@ -232,6 +232,7 @@ def build(self) -> "ExecutionPlan":
                 executable_map,
             ),
             executor_name=executor_name,
+            resolved_run_config=self.resolved_run_config,
         )
 
         if self.step_keys_to_execute is not None:
@@ -611,6 +612,7 @@ class ExecutionPlan(
             ("artifacts_persisted", bool),
             ("step_dict_by_key", Dict[str, IExecutionStep]),
             ("executor_name", Optional[str]),
+            ("resolved_run_config", Optional[ResolvedRunConfig]),
         ],
     )
 ):
@@ -624,6 +626,7 @@ def __new__(
         artifacts_persisted: bool = False,
         step_dict_by_key: Optional[Dict[str, IExecutionStep]] = None,
         executor_name: Optional[str] = None,
+        resolved_run_config: Optional[ResolvedRunConfig] = None,
     ):
         return super(ExecutionPlan, cls).__new__(
             cls,
@@ -659,6 +662,11 @@ def __new__(
                 ),
             ),
             executor_name=check.opt_str_param(executor_name, "executor_name"),
+            # the run config this plan was resolved against, so that contexts created for the same
+            # run can skip re-resolving it. Not available on plans rebuilt from a snapshot.
+            resolved_run_config=check.opt_inst_param(
+                resolved_run_config, "resolved_run_config", ResolvedRunConfig
+            ),
         )
 
     @property
@@ -844,6 +852,7 @@ def build_subset_plan(
                 executable_map,
             ),
             executor_name=self.executor_name,
+            resolved_run_config=resolved_run_config,
         )
 
     def get_version_for_step_output_handle(
@@ -1001,13 +1010,10 @@ def build(
         check.inst_param(pipeline, "pipeline", IPipeline)
         check.inst_param(resolved_run_config, "resolved_run_config", ResolvedRunConfig)
         check.opt_nullable_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
-        known_state = check.opt_inst_param(
-            known_state,
-            "known_state",
-            KnownExecutionState,
+        known_state = check.opt_inst_param(known_state, "known_state", KnownExecutionState)
+        if known_state is None:
             # may be good to force call sites to specify instead of defaulting to unknown
-            default=KnownExecutionState(),
-        )
+            known_state = KnownExecutionState()
         tags = check.opt_dict_param(tags, "tags", key_type=str, value_type=str)
 
         plan_builder = _PlanBuilder(
@@ -1157,6 +1163,7 @@ def _update_from_resolved_dynamic_outputs(
 ) -> None:
     resolved_steps = []
     key_sets_to_clear = []
+    step_handles_to_execute_set = set(step_handles_to_execute)
 
     # find entries in the resolvable map whose requirements are now all ready
     for required_keys, unresolved_step_handles in resolvable_map.items():
@@ -1167,7 +1174,7 @@ def _update_from_resolved_dynamic_outputs(
 
         for unresolved_step_handle in unresolved_step_handles:
             # don't resolve steps we are not executing
-            if unresolved_step_handle not in step_handles_to_execute:
+            if unresolved_step_handle not in step_handles_to_execute_set:
                 continue
 
             resolvable_step = step_dict[unresolved_step_handle]
@@ -1318,14 +1325,18 @@ def _compute_artifacts_persisted(
     if len(step_dict) == 0:
         return False
 
-    steps_by_level = _get_steps_to_execute_by_level(
-        step_dict, step_dict_by_key, step_handles_to_execute, executable_map
-    )
+    # Only the first topological level is needed, so find it directly from the dependency map
+    # rather than sorting the entire plan. Like toposort, this treats dependencies that are not
+    # themselves keys as having no upstream steps.
+    step_deps = _get_executable_step_deps(step_dict, step_handles_to_execute, executable_map)
+    border_step_keys = {step_key for step_key, deps in step_deps.items() if not deps}
+    border_step_keys.update(set().union(*step_deps.values()) - step_deps.keys())
 
-    if len(steps_by_level) == 0:
+    if len(border_step_keys) == 0:
         return False
 
-    for step in steps_by_level[0]:
+    for step_key in sorted(border_step_keys):
+        step = cast(ExecutionStep, step_dict_by_key[step_key])
         # check if all its inputs' upstream step outputs have non-in-memory IO manager configured
         for step_input in step.step_inputs:
             for step_output_handle in step_input.get_step_output_handle_dependencies():
@@ -1377,7 +1388,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
@@ -1435,7 +1446,7 @@ def _compute_step_maps(step_dict, step_dict_by_key, step_handles_to_execute, kno
             step_keys=missing_steps,
         )
 
-    step_keys_to_execute = [step_handle.to_key() for step_handle in step_handles_to_execute]
+    step_keys_to_execute = {step_handle.to_key() for step_handle in step_handles_to_execute}
 
     executable_map = {}
     resolvable_map: Dict[str, List[UnresolvedStepHandle]] = defaultdict(list)
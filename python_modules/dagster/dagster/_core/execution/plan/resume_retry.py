@@ -97,13 +97,16 @@ def get_retry_steps_from_parent_run(
                 _update_tracking_dict(interrupted_steps_in_parent_run_logs, step_handle)
 
     to_retry = defaultdict(set)
+    parent_step_keys_to_execute = (
+        set(parent_run.step_keys_to_execute) if parent_run.step_keys_to_execute else None
+    )
 
     execution_deps = execution_plan.execution_deps()
     for step_snap in execution_plan.topological_steps():
         step_key = step_snap.key
         step_handle = StepHandle.parse_from_key(step_snap.key)
 
-        if parent_run.step_keys_to_execute and step_snap.key not in parent_run.step_keys_to_execute:
+        if parent_step_keys_to_execute and step_snap.key not in parent_step_keys_to_execute:
             continue
 
         if step_snap.key in failed_steps_in_parent_run_logs:
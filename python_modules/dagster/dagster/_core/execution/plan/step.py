@@ -17,7 +17,6 @@
 import dagster._check as check
 from dagster._core.definitions.utils import validate_tags
 from dagster._serdes.serdes import DefaultEnumSerializer, whitelist_for_serdes
-from dagster._utils import merge_dicts
 
 from .handle import ResolvedFromDynamicStepHandle, StepHandle, UnresolvedStepHandle
 from .inputs import StepInput, UnresolvedCollectStepInput, UnresolvedMappedStepInput
@@ -134,10 +133,24 @@ def __new__(
         logging_tags: Optional[Dict[str, str]] = None,
         key: Optional[str] = None,
     ):
+        check.inst_param(handle, "handle", (StepHandle, ResolvedFromDynamicStepHandle))
+        check.str_param(pipeline_name, "pipeline_name")
+        check.opt_dict_param(logging_tags, "logging_tags")
+        step_key = handle.to_key()
+
+        # steps are constructed for every solid each time a plan is built, so build tags in place
+        step_logging_tags = {
+            "step_key": step_key,
+            "pipeline_name": pipeline_name,
+            "solid_name": handle.solid_handle.name,
+        }
+        if logging_tags:
+            step_logging_tags.update(logging_tags)
+
         return super(ExecutionStep, cls).__new__(
             cls,
-            handle=check.inst_param(handle, "handle", (StepHandle, ResolvedFromDynamicStepHandle)),
-            pipeline_name=check.str_param(pipeline_name, "pipeline_name"),
+            handle=handle,
+            pipeline_name=pipeline_name,
             step_input_dict={
                 si.name: si
                 for si in check.list_param(step_inputs, "step_inputs", of_type=StepInput)
@@ -147,16 +160,9 @@ def __new__(
                 for so in check.list_param(step_outputs, "step_outputs", of_type=StepOutput)
             },
             tags=validate_tags(check.opt_dict_param(tags, "tags", key_type=str)),
-            logging_tags=merge_dicts(
-                {
-                    "step_key": handle.to_key(),
-                    "pipeline_name": pipeline_name,
-                    "solid_name": handle.solid_handle.name,
-                },
-                check.opt_dict_param(logging_tags, "logging_tags"),
-            ),
+            logging_tags=step_logging_tags,
             # mypy can't tell that if default is set, this is guaranteed to be a str
-            key=cast(str, check.opt_str_param(key, "key", default=handle.to_key())),
+            key=cast(str, check.opt_str_param(key, "key", default=step_key)),
         )
 
     @property
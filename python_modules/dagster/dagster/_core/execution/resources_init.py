@@ -85,8 +85,11 @@ def resolve_resource_dependencies(
 
 def ensure_resource_deps_satisfiable(resource_deps: Mapping[str, AbstractSet[str]]) -> None:
     path = set()  # resources we are currently checking the dependencies of
+    checked = set()  # resources whose dependencies have already been fully checked
 
     def _helper(resource_key):
+        if resource_key in checked:
+            return
         path.add(resource_key)
         for reqd_resource_key in resource_deps[resource_key]:
             if reqd_resource_key in path:
@@ -101,6 +104,7 @@ def _helper(resource_key):
                 )
             _helper(reqd_resource_key)
         path.remove(resource_key)
+        checked.add(resource_key)
 
     for resource_key in sorted(list(resource_deps.keys())):
         _helper(resource_key)
@@ -113,16 +117,22 @@ def get_dependencies(
 
     Uses dfs to get all required dependencies from a particular resource. Assumes that resource dependencies are not cyclic (check performed by a different function).
     """
-    reqd_resources = set()
+    reqd_resources: Set[str] = set()
+    _add_dependencies(resource_name, resource_deps, reqd_resources)
+    return reqd_resources
 
-    # adds dependencies for a given resource key to reqd_resources
-    def _get_deps_helper(resource_key):
-        for reqd_resource_key in resource_deps[resource_key]:
-            _get_deps_helper(reqd_resource_key)
-        reqd_resources.add(resource_key)
 
-    _get_deps_helper(resource_name)
-    return reqd_resources
+def _add_dependencies(
+    resource_name: str, resource_deps: Mapping[str, AbstractSet[str]], reqd_resources: Set[str]
+) -> None:
+    # adds dependencies for a given resource key to reqd_resources, skipping any resource already
+    # collected (along with its dependencies) by an earlier traversal
+    if resource_name in reqd_resources:
+        return
+
+    for reqd_resource_key in resource_deps[resource_name]:
+        _add_dependencies(reqd_resource_key, resource_deps, reqd_resources)
+    reqd_resources.add(resource_name)
 
 
 def _core_resource_initialization_event_generator(
@@ -339,8 +349,14 @@ def single_resource_event_generator(
                         resource_or_gen, ContextDecorator
                     )
 
-                    resource_iter = _wrapped_resource_iterator(resource_or_gen)
-                    resource = next(resource_iter)
+                    # Plain resource objects need no teardown, so skip wrapping them in a generator
+                    resource_iter: Optional[Generator[Any, None, None]]
+                    if is_gen:
+                        resource_iter = _wrapped_resource_iterator(resource_or_gen)
+                        resource = next(resource_iter)
+                    else:
+                        resource_iter = None
+                        resource = resource_or_gen
                 resource = InitializedResource(
                     resource, format_duration(timer_result.millis), is_gen
                 )
@@ -354,6 +370,9 @@ def single_resource_event_generator(
     except DagsterUserCodeExecutionError as dagster_user_error:
         raise dagster_user_error
 
+    if resource_iter is None:
+        return
+
     with user_code_error_boundary(DagsterResourceFunctionError, msg_fn, log_manager=context.log):
         try:
             next(resource_iter)
@@ -371,16 +390,17 @@ def get_required_resource_keys_to_init(
     resolved_run_config: ResolvedRunConfig,
 ) -> AbstractSet[str]:
     resource_keys: Set[str] = set()
+    step_handles_to_execute = set(execution_plan.step_handles_to_execute)
 
     for step_handle, step in execution_plan.step_dict.items():
-        if step_handle not in execution_plan.step_handles_to_execute:
+        if step_handle not in step_handles_to_execute:
             continue
 
         hook_defs = pipeline_def.get_all_hooks_for_handle(step.solid_handle)
         for hook_def in hook_defs:
-            resource_keys = resource_keys.union(hook_def.required_resource_keys)
+            resource_keys.update(hook_def.required_resource_keys)
 
-        resource_keys = resource_keys.union(
+        resource_keys.update(
             get_required_resource_keys_for_step(pipeline_def, step, execution_plan)
         )
 
@@ -398,9 +418,7 @@ def get_transitive_required_resource_keys(
     transitive_required_resource_keys: Set[str] = set()
 
     for resource_key in required_resource_keys:
-        transitive_required_resource_keys = transitive_required_resource_keys.union(
-            set(get_dependencies(resource_key, resource_dependencies))
-        )
+        _add_dependencies(resource_key, resource_dependencies, transitive_required_resource_keys)
 
     return transitive_required_resource_keys
 
@@ -412,18 +430,18 @@ def get_required_resource_keys_for_step(
 
     # add all the solid compute resource keys
     solid_def = pipeline_def.get_solid(execution_step.solid_handle).definition
-    resource_keys = resource_keys.union(solid_def.required_resource_keys)
+    resource_keys.update(solid_def.required_resource_keys)
 
     # add input type, input loader, and input io manager resource keys
     for step_input in execution_step.step_inputs:
         input_def = solid_def.input_def_named(step_input.name)
 
-        resource_keys = resource_keys.union(input_def.dagster_type.required_resource_keys)
+        resource_keys.update(input_def.dagster_type.required_resource_keys)
 
-        resource_keys = resource_keys.union(step_input.source.required_resource_keys(pipeline_def))
+        resource_keys.update(step_input.source.required_resource_keys(pipeline_def))
 
         if input_def.input_manager_key:
-            resource_keys = resource_keys.union([input_def.input_manager_key])
+            resource_keys.add(input_def.input_manager_key)
 
         if isinstance(step_input, StepInput):
             source_handles = step_input.get_step_output_handle_dependencies()
@@ -437,7 +455,7 @@ def get_required_resource_keys_for_step(
         for source_handle in source_handles:
             source_manager_key = execution_plan.get_manager_key(source_handle, pipeline_def)
             if source_manager_key:
-                resource_keys = resource_keys.union([source_manager_key])
+                resource_keys.add(source_manager_key)
 
     # add output type, output materializer, and output io manager resource keys
     for step_output in execution_step.step_outputs:
@@ -445,13 +463,11 @@ def get_required_resource_keys_for_step(
         # Load the output type
         output_def = solid_def.output_def_named(step_output.name)
 
-        resource_keys = resource_keys.union(output_def.dagster_type.required_resource_keys)
+        resource_keys.update(output_def.dagster_type.required_resource_keys)
         if step_output.should_materialize and output_def.dagster_type.materializer:
-            resource_keys = resource_keys.union(
-                output_def.dagster_type.materializer.required_resource_keys()
-            )
+            resource_keys.update(output_def.dagster_type.materializer.required_resource_keys())
         if output_def.io_manager_key:
-            resource_keys = resource_keys.union([output_def.io_manager_key])
+            resource_keys.add(output_def.io_manager_key)
 
     return frozenset(resource_keys)
 
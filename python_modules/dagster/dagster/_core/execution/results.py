@@ -10,12 +10,23 @@
 from dagster._core.execution.plan.utils import build_resources_for_manager
 
 
-def _construct_events_by_step_key(event_list):
+def _construct_event_indices(event_list):
+    """Index the events by step key, and the step events by solid handle and step kind, in a single
+    pass over the event list."""
     events_by_step_key = defaultdict(list)
+    step_events_by_solid_handle = defaultdict(lambda: defaultdict(list))
     for event in event_list:
         events_by_step_key[event.step_key].append(event)
+        if event.is_step_event:
+            step_events_by_solid_handle[event.solid_handle][event.step_kind].append(event)
 
-    return dict(events_by_step_key)
+    return (
+        dict(events_by_step_key),
+        {
+            handle: dict(events_by_kind)
+            for handle, events_by_kind in step_events_by_solid_handle.items()
+        },
+    )
 
 
 class GraphExecutionResult:
@@ -36,12 +47,15 @@ def __init__(
         self.output_capture = check.opt_dict_param(
             output_capture, "output_capture", key_type=StepOutputHandle
         )
-        self._events_by_step_key = _construct_events_by_step_key(event_list)
+        (
+            self._events_by_step_key,
+            self._step_events_by_solid_handle,
+        ) = _construct_event_indices(event_list)
 
     @property
     def success(self):
         """bool: Whether all steps in the execution were successful."""
-        return all([not event.is_failure for event in self.event_list])
+        return not any(event.is_failure for event in self.event_list)
 
     @property
     def step_event_list(self):
@@ -101,14 +115,21 @@ def _result_for_handle(self, solid, handle):
             )
 
         events_by_kind = defaultdict(list)
+        solid_handle = handle.with_ancestor(self.handle)
 
         if solid.is_graph:
+            # check each distinct handle once, rather than every event, for whether it falls within
+            # the composite
+            descendant_handles = {
+                event_solid_handle
+                for event_solid_handle in self._step_events_by_solid_handle
+                if event_solid_handle.is_or_descends_from(solid_handle)
+            }
             events = []
             for event in self.event_list:
-                if event.is_step_event:
-                    if event.solid_handle.is_or_descends_from(handle.with_ancestor(self.handle)):
-                        events_by_kind[event.step_kind].append(event)
-                        events.append(event)
+                if event.is_step_event and event.solid_handle in descendant_handles:
+                    events_by_kind[event.step_kind].append(event)
+                    events.append(event)
 
             return CompositeSolidExecutionResult(
                 solid,
@@ -116,14 +137,15 @@ def _result_for_handle(self, solid, handle):
                 events_by_kind,
                 self.reconstruct_context,
                 self.pipeline_def,
-                handle=handle.with_ancestor(self.handle),
+                handle=solid_handle,
                 output_capture=self.output_capture,
             )
         else:
-            for event in self.event_list:
-                if event.is_step_event:
-                    if event.solid_handle.is_or_descends_from(handle.with_ancestor(self.handle)):
-                        events_by_kind[event.step_kind].append(event)
+            # a leaf solid has no descendants, so its events are exactly those for its handle
+            # copy the lists so the child result cannot mutate this result's index
+            step_events_by_kind = self._step_events_by_solid_handle.get(solid_handle, {})
+            for step_kind, step_events in step_events_by_kind.items():
+                events_by_kind[step_kind] = list(step_events)
 
             return SolidExecutionResult(
                 solid,
@@ -307,6 +329,29 @@ def __init__(
         self.output_capture = check.opt_dict_param(output_capture, "output_capture")
         self.pipeline_def = check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
 
+        # the step events are fixed once the result is constructed, so summarize them up front
+        # rather than rescanning them each time success / skipped / failure_data is accessed
+        self._step_failure_event = None
+        self._any_step_success = False
+        self._all_steps_skipped = True
+        self._compute_events_by_type = defaultdict(list)
+        self._successful_output_events_by_name = defaultdict(list)
+        for step_event in self.compute_step_events:
+            self._compute_events_by_type[step_event.event_type].append(step_event)
+            if step_event.is_successful_output:
+                self._successful_output_events_by_name[
+                    step_event.step_output_data.output_name
+                ].append(step_event)
+
+            if step_event.event_type == DagsterEventType.STEP_FAILURE:
+                if self._step_failure_event is None:
+                    self._step_failure_event = step_event
+            elif step_event.event_type == DagsterEventType.STEP_SUCCESS:
+                self._any_step_success = True
+
+            if step_event.event_type != DagsterEventType.STEP_SKIPPED:
+                self._all_steps_skipped = False
+
     @property
     def compute_input_event_dict(self):
         """Dict[str, DagsterEvent]: All events of type ``STEP_INPUT``, keyed by input name."""
@@ -389,9 +434,7 @@ def expectation_events_during_compute(self):
         return self._compute_steps_of_type(DagsterEventType.STEP_EXPECTATION_RESULT)
 
     def _compute_steps_of_type(self, dagster_event_type):
-        return list(
-            filter(lambda se: se.event_type == dagster_event_type, self.compute_step_events)
-        )
+        return list(self._compute_events_by_type.get(dagster_event_type, []))
 
     @property
     def expectation_results_during_compute(self):
@@ -424,24 +467,12 @@ def compute_step_failure_event(self):
     @property
     def success(self):
         """bool: Whether solid execution was successful."""
-        any_success = False
-        for step_event in self.compute_step_events:
-            if step_event.event_type == DagsterEventType.STEP_FAILURE:
-                return False
-            if step_event.event_type == DagsterEventType.STEP_SUCCESS:
-                any_success = True
-
-        return any_success
+        return self._step_failure_event is None and self._any_step_success
 
     @property
     def skipped(self):
         """bool: Whether solid execution was skipped."""
-        return all(
-            [
-                step_event.event_type == DagsterEventType.STEP_SKIPPED
-                for step_event in self.compute_step_events
-            ]
-        )
+        return self._all_steps_skipped
 
     @property
     def output_values(self):
@@ -509,36 +540,8 @@ def output_value(self, output_name=DEFAULT_OUTPUT):
         if not self.success:
             return None
 
-        with self.reconstruct_context() as context:
-            found = False
-            result = None
-            for compute_step_event in self.compute_step_events:
-                if (
-                    compute_step_event.is_successful_output
-                    and compute_step_event.step_output_data.output_name == output_name
-                ):
-                    found = True
-                    output = compute_step_event.step_output_data
-                    step = context.execution_plan.get_step_by_key(compute_step_event.step_key)
-                    value = self._get_value(context.for_step(step), output)
-                    check.invariant(
-                        not (output.mapping_key and step.get_mapping_key()),
-                        "Not set up to handle mapped outputs downstream of mapped steps",
-                    )
-                    mapping_key = output.mapping_key or step.get_mapping_key()
-                    if mapping_key:
-                        if result is None:
-                            result = {mapping_key: value}
-                        else:
-                            result[
-                                mapping_key
-                            ] = value  # pylint:disable=unsupported-assignment-operation
-                    else:
-                        result = value
-
-            if found:
-                return result
-
+        output_events = self._successful_output_events_by_name.get(output_name)
+        if not output_events:
             raise DagsterInvariantViolationError(
                 (
                     "Did not find result {output_name} in solid {self.solid.name} "
@@ -546,6 +549,29 @@ def output_value(self, output_name=DEFAULT_OUTPUT):
                 ).format(output_name=output_name, self=self)
             )
 
+        with self.reconstruct_context() as context:
+            result = None
+            for compute_step_event in output_events:
+                output = compute_step_event.step_output_data
+                step = context.execution_plan.get_step_by_key(compute_step_event.step_key)
+                value = self._get_value(context.for_step(step), output)
+                check.invariant(
+                    not (output.mapping_key and step.get_mapping_key()),
+                    "Not set up to handle mapped outputs downstream of mapped steps",
+                )
+                mapping_key = output.mapping_key or step.get_mapping_key()
+                if mapping_key:
+                    if result is None:
+                        result = {mapping_key: value}
+                    else:
+                        result[
+                            mapping_key
+                        ] = value  # pylint:disable=unsupported-assignment-operation
+                else:
+                    result = value
+
+            return result
+
     def _get_value(self, context, step_output_data):
         step_output_handle = step_output_data.step_output_handle
         # output capture dictionary will only have values in the in process case, but will not have
@@ -571,9 +597,10 @@ def _get_value(self, context, step_output_data):
     def failure_data(self):
         """Union[None, StepFailureData]: Any data corresponding to this step's failure, if it
         failed."""
-        for step_event in self.compute_step_events:
-            if step_event.event_type == DagsterEventType.STEP_FAILURE:
-                return step_event.step_failure_data
+        if self._step_failure_event is None:
+            return None
+
+        return self._step_failure_event.step_failure_data
 
     @property
     def retry_attempts(self) -> int:
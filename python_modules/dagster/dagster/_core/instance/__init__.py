@@ -1028,9 +1028,10 @@ def _log_asset_materialization_planned_events(self, pipeline_run, execution_plan
         from dagster._core.execution.context_creation_pipeline import initialize_console_manager
 
         pipeline_name = pipeline_run.pipeline_name
+        step_keys_to_execute = set(execution_plan_snapshot.step_keys_to_execute)
 
         for step in execution_plan_snapshot.steps:
-            if step.key in execution_plan_snapshot.step_keys_to_execute:
+            if step.key in step_keys_to_execute:
                 for output in step.outputs:
                     asset_key = output.properties.asset_key
                     if asset_key:
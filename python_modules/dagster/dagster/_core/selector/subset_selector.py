@@ -407,7 +407,7 @@ def parse_solid_selection(
     if len(solid_selection) == 1 and solid_selection[0] == "*":
         return frozenset(pipeline_def.graph.node_names())
 
-    graph = generate_dep_graph(pipeline_def)
+    graph = pipeline_def.get_dependency_graph()
     solids_set = set()
 
     # loop over clauses
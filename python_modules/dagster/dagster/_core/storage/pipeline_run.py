@@ -1,3 +1,4 @@
+import sys
 import warnings
 from datetime import datetime
 from enum import Enum
@@ -729,10 +730,22 @@ class ExecutionSelector(
     """
 
     def __new__(cls, name: str, solid_subset: Optional[List[str]] = None):
+        # These are only ever loaded from old runs, which repeat the same pipeline and solid names
+        # across many records, so intern the names rather than keeping a copy per run.
         return super(ExecutionSelector, cls).__new__(
             cls,
-            name=check.str_param(name, "name"),
+            name=_intern_if_str(check.str_param(name, "name")),
             solid_subset=None
             if solid_subset is None
-            else check.list_param(solid_subset, "solid_subset", of_type=str),
+            else [
+                _intern_if_str(solid_name)
+                for solid_name in check.list_param(solid_subset, "solid_subset", of_type=str)
+            ],
         )
+
+
+def _intern_if_str(value: str) -> str:
+    # sys.intern only accepts exact str instances; str subclasses are kept as they are
+    if type(value) is not str:  # pylint: disable=unidiomatic-typecheck
+        return value
+    return sys.intern(value)
@@ -126,8 +126,9 @@ def _composite_descent(
 
         # the base case
         if isinstance(solid.definition, SolidDefinition):
+            solid_config = current_solid_config.get("config")
             config_mapped_solid_config = solid.definition.apply_config_mapping(
-                {"config": current_solid_config.get("config")}
+                {"config": solid_config}
             )
             if not config_mapped_solid_config.success:
                 raise DagsterInvalidConfigError(
@@ -136,8 +137,12 @@ def _composite_descent(
                     config_mapped_solid_config,
                 )
 
-            complete_config_object = merge_dicts(
-                current_solid_config, config_mapped_solid_config.value
+            # most solids have no config mapping, in which case the validated config comes back
+            # untouched and there is nothing to merge
+            complete_config_object = (
+                current_solid_config
+                if config_mapped_solid_config.value["config"] is solid_config
+                else merge_dicts(current_solid_config, config_mapped_solid_config.value)
             )
             yield SolidConfigEntry(current_handle, SolidConfig.from_dict(complete_config_object))
             continue
@@ -22,7 +22,7 @@
 from dagster._core.definitions.pipeline_definition import PipelineDefinition
 from dagster._core.definitions.resource_definition import ResourceDefinition
 from dagster._core.errors import DagsterInvalidConfigError
-from dagster._utils import ensure_single_item
+from dagster._utils import ensure_single_item, frozendict
 
 
 class SolidConfig(
@@ -215,14 +215,16 @@ def build(
         )
         input_configs = config_value.get("inputs", {})
 
+        # The processed config values are already frozen, so freezing the containers makes the
+        # whole record safe to share between callers without copying.
         return ResolvedRunConfig(
-            solids=solid_config_dict,
+            solids=frozendict(solid_config_dict),
             execution=ExecutionConfig.from_dict(config_mapped_execution_configs),
-            loggers=config_mapped_logger_configs,
+            loggers=frozendict(config_mapped_logger_configs),
             original_config_dict=run_config,
-            resources=config_mapped_resource_configs,
+            resources=frozendict(config_mapped_resource_configs),
             mode=mode,
-            inputs=input_configs,
+            inputs=frozendict(input_configs),
         )
 
     def to_dict(self) -> Dict[str, Mapping[str, object]]:
@@ -32,7 +32,7 @@ def define_typed_input_schema_dict(value_config_type):
 
 
 def load_type_input_schema_dict(value):
-    file_type, file_options = list(value.items())[0]
+    file_type, file_options = next(iter(value.items()))
     if file_type == "value":
         return file_options
     elif file_type == "json":
@@ -96,7 +96,7 @@ def define_builtin_scalar_output_schema(scalar_name):
     def _buildint_materializer(_context, config_value, runtime_value):
         from dagster._core.events import AssetMaterialization
 
-        file_type, file_options = list(config_value.items())[0]
+        file_type, file_options = next(iter(config_value.items()))
 
         if file_type == "json":
             json_file_path = file_options["path"]
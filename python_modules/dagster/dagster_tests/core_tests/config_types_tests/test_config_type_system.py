@@ -1206,3 +1206,41 @@ def test_order(context):
     assert execute_solid(
         test_order, run_config={"solids": {"test_order": {"config": alphabet}}}
     ).success
+
+
+def test_config_schema_snapshot_reused():
+    from dagster._config import config_schema_snapshot_from_config_type
+
+    config_type = Shape({"an_int": Int, "nested": {"a_str": Field(String, is_required=False)}})
+    snapshot = config_schema_snapshot_from_config_type(config_type)
+    assert config_schema_snapshot_from_config_type(config_type) is snapshot
+
+    assert validate_config(config_type, {"an_int": 1, "nested": {}}).success
+    assert not validate_config(config_type, {"an_int": "one", "nested": {}}).success
+    assert process_config(config_type, {"an_int": 1, "nested": {"a_str": "x"}}).value == {
+        "an_int": 1,
+        "nested": {"a_str": "x"},
+    }
+
+
+def test_field_default_processed_once():
+    config_type = Shape({"nested": Field({"an_int": Field(Int, default_value=1)})})
+
+    first = process_config(config_type, {}).value
+    assert first == {"nested": {"an_int": 1}}
+    assert process_config(config_type, {}).value["nested"] is first["nested"]
+    assert process_config(config_type, {"nested": {"an_int": 2}}).value == {"nested": {"an_int": 2}}
+
+
+def test_scalar_array_config():
+    assert process_config([Int], [1, 2, 3]).value == [1, 2, 3]
+
+    float_values = process_config([Float], [1, 2.5]).value
+    assert float_values == [1.0, 2.5]
+    assert all(isinstance(value, float) for value in float_values)
+
+    result = validate_config([Int], [1, "two", None])
+    assert not result.success
+    assert len(result.errors) == 2
+    assert "root[1]" in result.errors[0].message
+    assert "root[2]" in result.errors[1].message
@@ -1,6 +1,6 @@
 import os
 
-from dagster import Array, BoolSource, IntSource, Noneable, StringSource
+from dagster import Array, BoolSource, Field, IntSource, Noneable, Shape, StringSource
 from dagster._config import process_config
 from dagster._core.test_utils import environ
 
@@ -96,3 +96,15 @@ def test_bool_source():
     with environ({"DAGSTER_TEST_ENV_VAR": "True"}):
         assert process_config(BoolSource, {"env": "DAGSTER_TEST_ENV_VAR"}).success
         assert process_config(BoolSource, {"env": "DAGSTER_TEST_ENV_VAR"}).value == True
+
+
+def test_string_source_default_reprocessed():
+    config_type = Shape(
+        {"a_str": Field(StringSource, default_value={"env": "DAGSTER_TEST_ENV_VAR"})}
+    )
+
+    with environ({"DAGSTER_TEST_ENV_VAR": "foo"}):
+        assert process_config(config_type, {}).value == {"a_str": "foo"}
+
+    with environ({"DAGSTER_TEST_ENV_VAR": "bar"}):
+        assert process_config(config_type, {}).value == {"a_str": "bar"}
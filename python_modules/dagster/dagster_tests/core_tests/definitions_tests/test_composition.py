@@ -1016,3 +1016,38 @@ def dynamic_output_solid(_):
         @pipeline
         def _alias_invoked_dynamic_output_pipeline():
             dynamic_output_solid().alias("dynamic_output")
+
+
+def test_nested_composite_results():
+    @composite_solid
+    def inner():
+        return echo(return_one())
+
+    @composite_solid
+    def outer():
+        return echo(inner())
+
+    @pipeline
+    def nested_pipeline():
+        echo(outer())
+        return_two()
+
+    result = execute_pipeline(nested_pipeline)
+    assert result.success
+
+    outer_result = result.result_for_solid("outer")
+    assert {event.step_key for event in outer_result.step_event_list} == {
+        "outer.inner.return_one",
+        "outer.inner.echo",
+        "outer.echo",
+    }
+    assert outer_result.output_value() == 1
+
+    inner_result = outer_result.result_for_solid("inner")
+    assert {event.step_key for event in inner_result.step_event_list} == {
+        "outer.inner.return_one",
+        "outer.inner.echo",
+    }
+    assert result.result_for_handle("outer.inner.return_one").output_value() == 1
+    assert result.result_for_solid("echo").output_value() == 1
+    assert result.result_for_solid("return_two").output_value() == 2
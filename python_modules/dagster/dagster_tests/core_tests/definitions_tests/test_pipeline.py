@@ -322,3 +322,18 @@ def _fail():
             # so the two remaining have no positions and this is
             # ambiguous
             add_kw(return_two(), return_two(), return_two())
+
+
+def test_solid_result_events_are_independent_of_pipeline_result():
+    @pipeline
+    def test():
+        add_one(num=return_one())
+
+    result = execute_pipeline(test)
+    solid_result = result.result_for_solid("add_one")
+    for step_events in solid_result.step_events_by_kind.values():
+        step_events.clear()
+
+    fresh_result = result.result_for_solid("add_one")
+    assert fresh_result.compute_step_events
+    assert fresh_result.output_value() == 2
@@ -148,3 +148,96 @@ def test_recover_in_between_steps():
                 step_key="bar_op",
             )
         )
+
+
+def define_diamond_job():
+    @op
+    def start():
+        return 1
+
+    @op
+    def left(num):
+        return num
+
+    @op
+    def right(num):
+        return num
+
+    @op
+    def end(_left, _right):
+        pass
+
+    @job
+    def diamond_job():
+        num = start()
+        end(left(num), right(num))
+
+    return diamond_job
+
+
+def _success_events(job_name, step_key):
+    return [
+        DagsterEvent(
+            DagsterEventType.STEP_OUTPUT.value,
+            pipeline_name=job_name,
+            event_specific_data=StepOutputData(
+                StepOutputHandle(step_key=step_key, output_name="result")
+            ),
+            step_key=step_key,
+        ),
+        DagsterEvent(
+            DagsterEventType.STEP_SUCCESS.value,
+            pipeline_name=job_name,
+            event_specific_data=StepSuccessData(duration_ms=10.0),
+            step_key=step_key,
+        ),
+    ]
+
+
+def test_downstream_ready_after_last_upstream_completes():
+    diamond_job = define_diamond_job()
+
+    with create_execution_plan(diamond_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["start"]
+        for event in _success_events(diamond_job.name, "start"):
+            active_execution.handle_event(event)
+
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "left",
+            "right",
+        ]
+
+        for event in _success_events(diamond_job.name, "left"):
+            active_execution.handle_event(event)
+
+        # end still waits on right
+        assert not active_execution.get_steps_to_execute()
+
+        for event in _success_events(diamond_job.name, "right"):
+            active_execution.handle_event(event)
+
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["end"]
+        for event in _success_events(diamond_job.name, "end"):
+            active_execution.handle_event(event)
+
+        assert active_execution.is_complete
+
+
+def test_downstream_abandoned_after_upstream_failure():
+    diamond_job = define_diamond_job()
+
+    with create_execution_plan(diamond_job).start(RetryMode.DISABLED) as active_execution:
+        active_execution.get_steps_to_execute()
+        for event in _success_events(diamond_job.name, "start"):
+            active_execution.handle_event(event)
+
+        assert len(active_execution.get_steps_to_execute()) == 2
+        active_execution.mark_failed("left")
+        for event in _success_events(diamond_job.name, "right"):
+            active_execution.handle_event(event)
+
+        assert not active_execution.get_steps_to_execute()
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["end"]
+        active_execution.mark_abandoned("end")
+
+        assert active_execution.is_complete
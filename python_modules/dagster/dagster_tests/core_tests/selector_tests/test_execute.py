@@ -3,6 +3,7 @@
 import pytest
 
 from dagster import reexecute_pipeline_iterator
+from dagster._core.definitions import job_definition
 from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.pipeline_base import InMemoryPipeline
 from dagster._core.errors import DagsterExecutionStepNotFoundError, DagsterInvalidSubsetError
@@ -24,6 +25,55 @@ def test_subset_for_execution():
     assert result.success
 
 
+def test_subset_def_reused():
+    subset_def = foo_pipeline.get_pipeline_subset_def({"return_one", "add_nums"})
+    assert foo_pipeline.get_pipeline_subset_def(frozenset(["add_nums", "return_one"])) is subset_def
+    assert foo_pipeline.get_pipeline_subset_def({"return_one"}) is not subset_def
+    assert foo_pipeline.get_pipeline_subset_def(None) is foo_pipeline
+
+
+def test_subset_job_def_reused():
+    asset_job = asset_selection_job.get_job_def_for_subset_selection(
+        asset_selection=frozenset([AssetKey("my_asset")])
+    )
+    assert (
+        asset_selection_job.get_job_def_for_subset_selection(
+            asset_selection=frozenset([AssetKey("my_asset")])
+        )
+        is asset_job
+    )
+    assert asset_job.asset_selection_data.asset_selection == {AssetKey("my_asset")}
+    assert (
+        asset_selection_job.get_job_def_for_subset_selection(
+            asset_selection=frozenset([AssetKey("asset_2")])
+        )
+        is not asset_job
+    )
+
+    op_job = asset_selection_job.get_job_def_for_subset_selection(op_selection=["my_asset"])
+    assert asset_selection_job.get_job_def_for_subset_selection(op_selection=["my_asset"]) is op_job
+    op_pair_job = asset_selection_job.get_job_def_for_subset_selection(
+        op_selection=["my_asset", "asset_2"]
+    )
+    assert (
+        asset_selection_job.get_job_def_for_subset_selection(op_selection=["asset_2", "my_asset"])
+        is op_pair_job
+    )
+    assert asset_selection_job.get_job_def_for_subset_selection() is asset_selection_job
+
+
+def test_subset_job_def_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(job_definition, "_MAX_CACHED_SUBSET_JOB_DEFS", 1)
+
+    first_job = asset_selection_job.get_job_def_for_subset_selection(op_selection=["my_asset"])
+    asset_selection_job.get_job_def_for_subset_selection(op_selection=["asset_2"])
+
+    assert (
+        asset_selection_job.get_job_def_for_subset_selection(op_selection=["my_asset"])
+        is not first_job
+    )
+
+
 def test_asset_subset_for_execution():
     in_mem_pipeline = InMemoryPipeline(asset_selection_job)
     sub_pipeline = in_mem_pipeline.subset_for_execution(
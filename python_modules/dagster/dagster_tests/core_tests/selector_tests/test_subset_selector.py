@@ -68,6 +68,8 @@ def test_generate_dep_graph():
             "add_one": set(),
         },
     }
+    assert foo_pipeline.get_dependency_graph() == graph
+    assert foo_pipeline.get_dependency_graph() is foo_pipeline.get_dependency_graph()
 
 
 def test_traverser():
@@ -78,6 +78,12 @@ def noop_pipeline():
     snapshot.assert_match(serialize_pp(pipeline_snapshot))
     snapshot.assert_match(create_pipeline_snapshot_id(pipeline_snapshot))
 
+    assert noop_pipeline.get_pipeline_snapshot() == pipeline_snapshot
+    assert noop_pipeline.get_pipeline_snapshot() is noop_pipeline.get_pipeline_snapshot()
+    assert noop_pipeline.get_pipeline_snapshot_id() == create_pipeline_snapshot_id(
+        pipeline_snapshot
+    )
+
 
 def test_noop_deps_snap():
     @solid
@@ -18,6 +18,7 @@
 from dagster._core.storage.pipeline_run import (
     IN_PROGRESS_RUN_STATUSES,
     NON_IN_PROGRESS_RUN_STATUSES,
+    ExecutionSelector,
     PipelineRun,
     PipelineRunStatus,
     RunsFilter,
@@ -88,3 +89,29 @@ def test_runs_filter_supports_nonempty_run_ids():
 
 def test_serialize_runs_filter():
     deserialize_as(serialize_dagster_namedtuple(RunsFilter()), RunsFilter)
+
+
+def test_legacy_execution_selector_names_are_shared():
+    serialized = serialize_dagster_namedtuple(
+        ExecutionSelector("legacy_pipeline", ["solid_one", "solid_two"])
+    )
+    first = deserialize_as(serialized, ExecutionSelector)
+    second = deserialize_as(serialized, ExecutionSelector)
+
+    assert first == second
+    assert first.name is second.name
+    assert all(a is b for a, b in zip(first.solid_subset, second.solid_subset))
+
+
+def test_legacy_execution_selector_checks_types():
+    class PipelineName(str):
+        pass
+
+    name = PipelineName("legacy_pipeline")
+    assert ExecutionSelector(name).name is name
+
+    with pytest.raises(CheckError):
+        ExecutionSelector(1)
+
+    with pytest.raises(CheckError):
+        ExecutionSelector("legacy_pipeline", ["solid_one", 2])
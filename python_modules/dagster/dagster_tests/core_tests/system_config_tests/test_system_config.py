@@ -1,5 +1,7 @@
 import re
 
+import pytest
+
 from dagster import (
     Any,
     DependencyDefinition,
@@ -293,6 +295,9 @@ def test_whole_environment():
         "io_manager": ResourceConfig(None),
     }
 
+    with pytest.raises(RuntimeError):
+        env.solids["no_config_solid"] = SolidConfig.from_dict({})  # type: ignore
+
 
 def test_solid_config_error():
     pipeline_def = define_test_solids_config_pipeline()
@@ -256,6 +256,24 @@ def default_context_solid(context):
     assert called["yes"]
 
 
+def test_console_logger_output_across_runs(capsys):
+    run_ids = []
+
+    @solid(input_defs=[], output_defs=[])
+    def logger_solid(context):
+        run_ids.append(context.run_id)
+        context.log.info("hello from {run_id}".format(run_id=context.run_id))
+
+    execute_solid(logger_solid)
+    execute_solid(logger_solid)
+
+    assert len(run_ids) == 2
+    _, err = capsys.readouterr()
+    # each message is written once, to the stderr that was current when the run executed
+    for run_id in run_ids:
+        assert err.count("hello from {run_id}".format(run_id=run_id)) == 1
+
+
 def test_colored_console_logger_with_integer_log_level():
     @pipeline
     def pipe():
@@ -123,3 +123,86 @@ def test_clean_event_generator_exit():
 @solid
 def fake_solid(_):
     pass
+
+
+def test_context_creation_reuses_plan_run_config():
+    from dagster._core.execution.context_creation_pipeline import create_context_creation_data
+
+    pipeline_def = gen_basic_resource_pipeline()
+    instance = DagsterInstance.ephemeral()
+    execution_plan = create_execution_plan(pipeline_def)
+    assert execution_plan.resolved_run_config is not None
+
+    pipeline_run = instance.create_run_for_pipeline(
+        pipeline_def=pipeline_def, execution_plan=execution_plan
+    )
+    context_creation_data = create_context_creation_data(
+        InMemoryPipeline(pipeline_def), execution_plan, {}, pipeline_run, instance
+    )
+    assert context_creation_data.resolved_run_config is execution_plan.resolved_run_config
+
+    # different run config than the plan was built with is resolved again
+    context_creation_data = create_context_creation_data(
+        InMemoryPipeline(pipeline_def),
+        execution_plan,
+        {"loggers": {"console": {"config": {"log_level": "DEBUG"}}}},
+        pipeline_run,
+        instance,
+    )
+    assert context_creation_data.resolved_run_config is not execution_plan.resolved_run_config
+    assert (
+        context_creation_data.resolved_run_config.loggers["console"]["config"]["log_level"]
+        == "DEBUG"
+    )
+
+
+def test_transitive_required_resource_keys():
+    from dagster._core.execution.resources_init import get_transitive_required_resource_keys
+
+    def _resource_requiring(*keys):
+        @resource(required_resource_keys=set(keys))
+        def _resource(_):
+            pass
+
+        return _resource
+
+    # "shared" is reachable from "top" along two paths
+    resource_defs = {
+        "top": _resource_requiring("left", "right"),
+        "left": _resource_requiring("shared"),
+        "right": _resource_requiring("shared"),
+        "shared": _resource_requiring(),
+        "unused": _resource_requiring("shared"),
+    }
+
+    assert get_transitive_required_resource_keys({"top"}, resource_defs) == {
+        "top",
+        "left",
+        "right",
+        "shared",
+    }
+    assert get_transitive_required_resource_keys({"left", "right"}, resource_defs) == {
+        "left",
+        "right",
+        "shared",
+    }
+    assert get_transitive_required_resource_keys(set(), resource_defs) == set()
+
+
+def test_scoped_resources_type_reused():
+    from dagster._core.definitions.resource_definition import ScopedResourcesBuilder
+    from dagster._core.definitions.scoped_resources_builder import IContainsGenerator
+    from dagster._core.errors import DagsterUnknownResourceError
+
+    builder = ScopedResourcesBuilder({"a": 1, "b": 2})
+    resources = builder.build({"a"})
+    assert resources.a == 1
+    assert type(builder.build({"a"})) is type(resources)  # pylint: disable=unidiomatic-typecheck
+    assert not isinstance(resources, IContainsGenerator)
+
+    with pytest.raises(DagsterUnknownResourceError):
+        resources.b  # pylint: disable=pointless-statement
+
+    gen_resources = ScopedResourcesBuilder({"a": 1}, contains_generator=True).build({"a"})
+    assert gen_resources.a == 1
+    assert isinstance(gen_resources, IContainsGenerator)
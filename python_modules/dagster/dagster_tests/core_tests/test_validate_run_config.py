@@ -49,3 +49,35 @@ def pipeline_requires_config():
 
     with pytest.raises(DagsterInvalidConfigError):
         validate_run_config(pipeline_requires_config)
+
+
+def test_invalid_config_error_message():
+    @solid(config_schema={"foo": str, "bar": int})
+    def requires_config(_):
+        pass
+
+    @pipeline
+    def pipeline_requires_config():
+        requires_config()
+
+    with pytest.raises(DagsterInvalidConfigError) as exc_info:
+        validate_run_config(
+            pipeline_requires_config,
+            {"solids": {"requires_config": {"config": {"foo": 1, "bar": "baz"}}}},
+        )
+
+    err = exc_info.value
+    assert len(err.errors) == 2
+    expected = "\n".join(
+        ["Error in config for pipeline"]
+        + [
+            "    Error {i}: {message}".format(i=i + 1, message=message)
+            for i, message in enumerate(err.error_messages)
+        ]
+    )
+    assert err.message == expected
+    assert str(err) == expected
+    assert err.args[0] == expected
+
+    err.message = "replaced"
+    assert err.message == "replaced"
@@ -24,7 +24,7 @@ def check_events_for_failures(events):
 # here: http://bit.ly/2YtigEm
 def check_events_for_skips(events):
     check.list_param(events, "events", of_type=DagsterEvent)
-    skipped = any([e.event_type_value == DagsterEventType.STEP_SKIPPED.value for e in events])
+    skipped = any(e.event_type_value == DagsterEventType.STEP_SKIPPED.value for e in events)
     if skipped:
         raise AirflowSkipException("Dagster emitted skip event, skipping execution in Airflow")
 
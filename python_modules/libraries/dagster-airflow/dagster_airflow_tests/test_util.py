@@ -1,4 +1,12 @@
-from dagster_airflow.operators.util import convert_airflow_datestr_to_epoch_ts
+import pytest
+from airflow.exceptions import AirflowException, AirflowSkipException
+from dagster_airflow.operators.util import (
+    check_events_for_failures,
+    check_events_for_skips,
+    convert_airflow_datestr_to_epoch_ts,
+)
+
+from dagster import Out, Output, job, op
 
 EPS = 1e-6
 
@@ -16,3 +24,63 @@ def test_airflow_ts():
     example = "1900-01-08T00:00:00+00:00"
     res = convert_airflow_datestr_to_epoch_ts(example)
     assert abs(res - -2208384000.0) < EPS
+
+
+@op
+def emit_one():
+    return 1
+
+
+@op
+def raise_unusual_error(_num):
+    raise Exception("Unusual error")
+
+
+@op(out=Out(is_required=False))
+def emit_nothing():
+    if False:  # pylint: disable=using-constant-test
+        yield Output(1)
+
+
+@op
+def consume(num):
+    return num
+
+
+def _run_events(job_def):
+    return job_def.execute_in_process(raise_on_error=False).all_events
+
+
+def test_check_events_for_failures():
+    @job
+    def failing_job():
+        raise_unusual_error(emit_one())
+
+    events = _run_events(failing_job)
+
+    with pytest.raises(AirflowException, match="Exception: Unusual error"):
+        check_events_for_failures(events)
+    check_events_for_skips(events)
+
+
+def test_check_events_for_skips():
+    @job
+    def skipping_job():
+        consume(emit_nothing())
+
+    events = _run_events(skipping_job)
+
+    check_events_for_failures(events)
+    with pytest.raises(AirflowSkipException):
+        check_events_for_skips(events)
+
+
+def test_check_events_for_successful_run():
+    @job
+    def successful_job():
+        consume(emit_one())
+
+    events = _run_events(successful_job)
+
+    check_events_for_failures(events)
+    check_events_for_skips(events)